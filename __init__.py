@@ -1,10 +1,63 @@
-import pyodbc, glob, csv
+import pyodbc, csv, os, sys, threading
+from fnmatch import fnmatch
+from collections import OrderedDict, defaultdict
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+# Number of threads used to read files in GetPages and GetTagValues
+_FILE_READ_WORKERS = 16
+
+# Shortname prefixes used by Tag.assumed_type_ab, as (tag_type, [prefix])
+_AB_TAG_TYPES = [
+    ("AB_AI", [ "LT", "LIT", "AIT", "FIT", "PIT", "TT", "WIT", "ZA", "ZS" ] ),
+    ("AB_DA", [ "TAH", "TAL", "LAHH", "SD", "LS", "VAH", "PAH", "PAL", "FAL", "LAL", "LAH" ] ),
+    ("AB_FV", [ "FV" ] ),
+    ("AB_FCV", [ "FCV" ] ),
+    ("AB_MOTOR", [ "P", "CP", "SC", "BL", "CF" ] ),
+    ("AB_TOTALIZER", [ ] )]
+
+# Flattened to { prefix: tag_type } so each lookup is a single dict access
+_AB_PREFIX_TO_TYPE = {prefix: tag_type for tag_type, prefixes in _AB_TAG_TYPES for prefix in prefixes}
+
+
+class _TagValueDict(MutableMapping):
+    '''A { column: value } view of a tag's values, used by Tag.value_dict.
+    Columns are fixed by the tag type, so they can be set but not added or removed.'''
+
+    __slots__ = ('_tag',)
+
+    def __init__(self, tag):
+        self._tag = tag
+
+    def __getitem__(self, column):
+        return self._tag.values[Tag._column_index[self._tag.tag_type][column]]
+
+    def __setitem__(self, column, value):
+        self._tag.set(column, value)
+
+    def __delitem__(self, column):
+        raise TypeError("Tag columns can't be removed.")
+
+    def __iter__(self):
+        return iter(Tag._column_names[self._tag.tag_type])
+
+    def __len__(self):
+        return len(Tag._column_names[self._tag.tag_type])
+
+    def __repr__(self):
+        return repr(dict(self))
+
 
 class Tag:
     '''A class to represent a VTScada tag.'''
 
+    __slots__ = ('tag_type', 'values')
+
     id_col = r'Export Info - leave blank for new records'
+    _id_properties = [id_col, "AuditName", "Original Shortname"]
     _column_names = {}
+    _column_index = {}
 
 
     def __init__(self, tag_type : str, columns : list, values : list):
@@ -16,17 +69,34 @@ class Tag:
             The name of the table this tag is found under in the tag export database.
         columns : list[str]
             The list of columns for the table this tag is found under in the tag export database, in order.
+            If this differs from the columns already seen for this tag type, the values are reordered to match those.
         values : list[str]
             The list of values for each column, in order.
+            Any iterable works (ie: a pyodbc Row), since the values are copied into the tag's own list.
         '''
         self.tag_type = tag_type
 
-        # Create a dictionary of { column[i]: value[i] }
-        self.value_dict = dict(zip(columns, values))
-        
-        # Keep track of column names for each tag type used
-        if tag_type not in Tag._column_names.keys():
+        # Keep track of column names for each tag type used, along with a shared { column: index }
+        if tag_type not in Tag._column_names:
             Tag._column_names[tag_type] = columns
+            Tag._column_index[tag_type] = {col: i for i, col in enumerate(columns)}
+
+        # Values are stored in the column order registered for the tag type, and looked up through its column index
+        registered_columns = Tag._column_names[tag_type]
+        if columns is registered_columns or columns == registered_columns:
+            self.values = list(values)
+        else:
+            # This tag comes from a database with a different column order, so move each value to its registered column.
+            # Registered columns this database doesn't have are left as None.
+            values = list(values)
+            index = dict(zip(columns, range(len(columns))))
+            self.values = [values[index[col]] if col in index else None for col in registered_columns]
+
+    @property
+    def value_dict(self) -> MutableMapping:
+        '''A dictionary of { column: value } for the tag.
+        This is a view of the tag's values, so setting a column here sets it on the tag.'''
+        return _TagValueDict(self)
 
     def set(self, column : str, value : str):
         '''Set the column value for the tag.
@@ -38,9 +108,17 @@ class Tag:
             You can use Tag.id_col for the Export Info column, rather than typing it all out.
         value : str
             The value being set.
+
+        Raises
+        ----------
+        KeyError
+            If the column is not one of the columns for this tag's tag type.
         '''
 
-        self.value_dict[column] = value
+        index = Tag._column_index[self.tag_type].get(column)
+        if index == None:
+            raise KeyError(f"'{column}' is not a column of tag type '{self.tag_type}'.")
+        self.values[index] = value
 
     def get(self, column : str) -> str:
         '''Gets the column value for the tag.
@@ -57,7 +135,8 @@ class Tag:
             The value for the given column, or None if the column is not found.
         '''
 
-        return self.value_dict[column] if column in self.value_dict.keys() else None
+        index = Tag._column_index[self.tag_type].get(column)
+        return self.values[index] if index != None else None
 
     def values_as_list(self) -> list:
         '''Gets the values of the tag as a list, in the order of the columns in the database.
@@ -68,9 +147,7 @@ class Tag:
         list[str]
             A list of the tag's values, in database order.'''
 
-        columns = Tag._column_names[self.tag_type]
-        values = [self.value_dict[col] for col in columns]
-        return values
+        return list(self.values)
 
     def remove_id_info(self):
         '''Sets the 'Export Info', 'AuditName', and 'Original Shortname' values to empty strings.
@@ -81,9 +158,8 @@ class Tag:
         Tag
             Returns the tag, for convenience.'''
 
-        id_properties = [Tag.id_col, "AuditName", "Original Shortname"]
-        for prop in id_properties:
-            if prop in self.value_dict.keys():
+        for prop in Tag._id_properties:
+            if prop in Tag._column_index[self.tag_type]:
                 self.set(prop, '')
         return self
 
@@ -97,27 +173,29 @@ class Tag:
         return Tag._column_names[self.tag_type]
 
     def shortname(self):
-        return self.get("Name").split('\\')[-1]
+        return self.get("Name").rpartition('\\')[2]
         
 
     @staticmethod
     def assumed_type_ab(name : str) -> str:
-        '''NOT YET IMPLEMENTED
-        The idea is to infer the tag type from the tag shortname
-        This will make creating tags easier, as you can simply specify the tag name and infer the type
-        The "config" for this should be stored in a file, so different naming schemes / type schemes can be loaded in'''
-        return
-
-        tagTypes =  [    
-            ("AB_AI", [ "LT", "LIT", "AIT", "FIT", "PIT", "TT", "WIT", "TT", "ZA", "ZS" ] ),
-            ("AB_DA", [ "TAH", "TAL", "LAHH", "SD", "LS", "VAH", "PAH", "PAL", "FAL", "LAL", "LAH" ] ),
-            ("AB_FV", [ "FV" ] ),
-            ("AB_FCV", [ "FCV" ] ),
-            ("AB_MOTOR", [ "P", "CP", "SC", "BL", "CF" ] ),
-            ("AB_TOTALIZER", [ ] )]
-        name = name.split('\\\\')[-1]
-        name = name.split('_')[0]
-        return next((t[0] for t in tagTypes if name in t[1]), None)
+        '''PARTIALLY IMPLEMENTED
+        Infers the tag type from the tag shortname, using the prefix before the first underscore (ie: "LIT" in "LIT_101").
+        This will make creating tags easier, as you can simply specify the tag name and infer the type.
+        The prefixes are hardcoded in _AB_TAG_TYPES for now. The "config" for this should be stored in a file,
+        so different naming schemes / type schemes can be loaded in.
+
+        Parameters
+        ----------
+        name : str
+            The Name of the tag. Everything before the slashes is dropped, so this can be the full path or the Short Name.
+
+        Returns
+        ----------
+        str
+            The assumed tag type, or None if the prefix isn't recognized.'''
+        name = name.rpartition('\\\\')[2]
+        name = name.partition('_')[0]
+        return _AB_PREFIX_TO_TYPE.get(name)
 
     @staticmethod
     def separate_tags_by_type(tag_list : list) -> dict:
@@ -133,24 +211,152 @@ class Tag:
         dict[str, list[Tag]]
             A dictionary of { tag_type: [Tag] }
         '''
-        tags_by_type = {}
+        tags_by_type = defaultdict(list)
         for tag in tag_list:
-            if tag.tag_type in tags_by_type.keys():
-                tags_by_type[tag.tag_type].append(tag)
-            else:
-                tags_by_type[tag.tag_type] = [tag]
-        return tags_by_type
+            tags_by_type[tag.tag_type].append(tag)
+        return dict(tags_by_type)
 
     def __str__(self):
-        vals = [v if v != None else '' for v in self.values_as_list()]
-        return '\t'.join(vals)
+        return '\t'.join('' if v is None else str(v) for v in self.values)
+
+
+
+def _quote_name(name : str) -> str:
+    '''Quotes a table or column name in square brackets, for use in a query.
+    Access has no way of escaping "]" inside brackets, so names containing it are refused.'''
+    if ']' in name:
+        raise ValueError(f"Can't use the name '{name}' in a query, since it contains ']'.")
+    return f'[{name}]'
+
+
+def _id_key(value):
+    '''Normalises a tag ID or name for comparing in Python the way Access compares text, which ignores case.'''
+    return value.casefold() if isinstance(value, str) else value
+
+
+class TagTable:
+    '''A class to represent every tag of one tag type, stored by column.
+    Each column's values are kept in a single list, rather than creating a Tag object per row,
+    which uses much less memory for large exports. Rows are referred to by index.'''
+
+    __slots__ = ('tag_type', 'columns', 'data')
+
+    def __init__(self, tag_type : str, columns : list, rows : list):
+        '''TagTable constructor.
+        
+        Parameters
+        ----------
+        tag_type : str
+            The name of the table these tags are found under in the tag export database.
+        columns : list[str]
+            The list of columns for the table, in order.
+        rows : list[list[str]]
+            The values of each tag, in column order.
+        '''
+        self.tag_type = tag_type
+        self.columns = columns
+
+        # Transpose the rows into a dictionary of { column: [value] }
+        if len(rows) == 0:
+            self.data = {col: [] for col in columns}
+        else:
+            self.data = {col: list(values) for col, values in zip(columns, zip(*rows))}
+
+    def __len__(self):
+        return len(self.data[self.columns[0]]) if self.columns else 0
+
+    def get(self, column : str, index : int) -> str:
+        '''Gets the column value for the tag at the given row.
+        
+        Parameters
+        ----------
+        column : str
+            The column name to get the value for.
+        index : int
+            The row of the tag.
+
+        Returns
+        ----------
+        str
+            The value for the given column, or None if the column is not found.
+        '''
+        values = self.data.get(column)
+        return values[index] if values != None else None
+
+    def set(self, column : str, index : int, value : str):
+        '''Set the column value for the tag at the given row.
+        
+        Parameters
+        ----------
+        column : str
+            The column name to set the value for.
+        index : int
+            The row of the tag.
+        value : str
+            The value being set.
+
+        Raises
+        ----------
+        KeyError
+            If the column is not one of the columns for this table.
+        '''
+        if column not in self.data:
+            raise KeyError(f"'{column}' is not a column of tag type '{self.tag_type}'.")
+        self.data[column][index] = value
+
+    def tag(self, index : int) -> Tag:
+        '''Creates a Tag object from the tag at the given row.
+        The Tag is a copy, so changing it doesn't change the table.
+        
+        Parameters
+        ----------
+        index : int
+            The row of the tag.
+
+        Returns
+        ----------
+        Tag
+            The tag at the given row.
+        '''
+        return Tag(self.tag_type, self.columns, (self.data[col][index] for col in self.columns))
+
+    def rows(self):
+        '''Gets the values of each tag, in the order of the columns in the database.
+        Mainly intended for database operations.
+
+        Returns
+        ----------
+        iterator[tuple[str]]
+            The values of each tag, in database order.'''
+        return zip(*(self.data[col] for col in self.columns))
+
+    def remove_id_info(self):
+        '''Sets the 'Export Info', 'AuditName', and 'Original Shortname' values to empty strings for every tag.
+        Useful for copying tags, or importing tags to a different database.
 
+        Returns
+        ----------
+        TagTable
+            Returns the table, for convenience.'''
+        for prop in Tag._id_properties:
+            if prop in self.data:
+                self.data[prop] = [''] * len(self)
+        return self
 
 
 class DBConnection:
     '''A class that encapsulates a connection to a VTScada tag export database.'''
 
-    def __init__(self, file : str):
+    # Number of rows requested from the driver at a time when reading tags
+    fetch_size = 10000
+
+    # Number of read cursors kept open for reuse, see _read_cursor()
+    read_cursor_cache_size = 16
+
+    # Most query parameters sent to the driver at once, when adding and updating tags in batches
+    max_batch_parameters = 2000
+
+    def __init__(self, file : str, read_workers : int = 1):
         '''DBConnection constructor.
         Connects to the database automatically when instantiated.
         
@@ -158,18 +364,78 @@ class DBConnection:
         ----------
         file : str
             The filepath to the MS Access .mdb file.
+        read_workers : int, optional
+            The number of connections used to read tables at the same time in get_tags(), when getting all tags.
+            Access limits how many connections can be open on one file, so this is off by default. (default is 1)
         '''
         self.filename = file
-        self.conn = pyodbc.connect(r'Driver={Microsoft Access Driver (*.mdb, *.accdb)};DBQ=' + file + ';')
+        self.read_workers = read_workers
+        self._connection_string = r'Driver={Microsoft Access Driver (*.mdb, *.accdb)};DBQ=' + file + ';'
+        self.conn = pyodbc.connect(self._connection_string, autocommit=False)
+
+        # Cursors for read queries, as { query: cursor }, with the least recently used first
+        self._read_cursors = OrderedDict()
+
+        # Short name lookups for get_tag_by_name(cache=True), as { table_name: { shortname: row } }
+        self._name_index = {}
 
         # Create a dictionary of { table_name: columns_as_tuple }
-        table_names =  (row.table_name for row in self.conn.cursor().tables() if row.table_type == 'TABLE')
-        self.table_columns = dict(((table, self.get_columns_by_type(table)) for table in table_names))
+        # Table and column names are interned, so every tag and dict using them shares one copy of each
+        table_names =  [sys.intern(row.table_name) for row in self.conn.cursor().tables() if row.table_type == 'TABLE']
+
+        # Read the columns of every table from the catalog in one call, rather than running a query per table
+        catalog = defaultdict(list)
+        for row in self.conn.cursor().columns():
+            catalog[row.table_name].append((row.ordinal_position, sys.intern(row.column_name)))
+        self.table_columns = {}
+        for table in table_names:
+            if table in catalog:
+                self.table_columns[table] = [col for _, col in sorted(catalog[table])]
+            else:
+                self.table_columns[table] = self.get_columns_by_type(table)
+
+        # The schema doesn't change while connected, so build the insert and update queries for each table up front
+        # Quote the table and column names once, so every query is built from the same text
+        self._quoted_table = {table: _quote_name(table) for table in self.table_columns}
+        self._quoted_cols = {table: [_quote_name(col) for col in columns] for table, columns in self.table_columns.items()}
+
+        self._insert_sql = {table: DBConnection._build_insert_sql(self._quoted_table[table], self._quoted_cols[table]) for table in self.table_columns}
+        self._update_sql = {table: DBConnection._build_update_sql(self._quoted_table[table], self._quoted_cols[table]) for table in self.table_columns}
 
     def close(self):
         '''Closes the database connection.
         The connection is also closed automatically when out of scope.'''
+        for cursor in self._read_cursors.values():
+            cursor.close()
+        self._read_cursors.clear()
         self.conn.close()
+
+    def _read_cursor(self, query : str, arraysize : int = None):
+        '''Gets a cursor to run the given read query on.
+        The same cursor is handed back each time a query is repeated, so the driver can reuse the prepared statement.
+        Only the most recently used queries are kept (see DBConnection.read_cursor_cache_size).
+        
+        Parameters
+        ----------
+        query : str
+            The SQL text of the query that will be executed on the cursor.
+        arraysize : int
+            The number of rows fetched per trip to the database. (default is DBConnection.fetch_size)
+
+        Returns
+        ----------
+        pyodbc.Cursor
+            A cursor, with arraysize set to the given arraysize.
+        '''
+        cursor = self._read_cursors.pop(query, None)
+        if cursor == None:
+            if len(self._read_cursors) >= DBConnection.read_cursor_cache_size:
+                self._read_cursors.popitem(last=False)[1].close()
+            cursor = self.conn.cursor()
+        # Set on every use, since the same cursor may be handed out with a different arraysize
+        cursor.arraysize = DBConnection.fetch_size if arraysize == None else arraysize
+        self._read_cursors[query] = cursor
+        return cursor
     
     def get_tags(self, tag_type : str = None) -> list:
         '''Creates and returns a list of Tag objects from the database.
@@ -185,20 +451,132 @@ class DBConnection:
         list[Tag]
             A list of Tag objects.
         '''
-        if tag_type == None: # Get all tags
-            cursor = self.conn.cursor()
-            tags = []
-            for table in self.table_columns.keys():
-                cursor.execute(f"select * from {table}")
-                table_tags = [Tag(table, self.table_columns[table], list(row)) for row in cursor]
-                tags.extend(table_tags)
-            return tags
-        else: # Get tags for a specific type
-            cursor = self.conn.cursor()
-            cursor.execute(f"select * from {tag_type}")
-            return [Tag(tag_type, self.table_columns[tag_type], row) for row in cursor]
+        # Get all tags, or tags for a specific type
+        tables = list(self.table_columns) if tag_type == None else [tag_type]
+
+        table_rows = None
+        if tag_type == None and self.read_workers > 1:
+            try:
+                table_rows = self._read_tables_parallel(tables)
+            except pyodbc.Error:
+                pass # Extra connections were refused, so read one table at a time instead
+        if table_rows == None:
+            # Every tag is kept anyway, so each table is fetched in one go
+            table_rows = ((table, self._read_all_rows(table)) for table in tables)
 
-    def add_tags(self, tag_list : list, remove_id_info : bool = True):
+        tags = []
+        for table, rows in table_rows:
+            tags.extend(map(partial(Tag, table, self.table_columns[table]), rows))
+        return tags
+
+    def _read_all_rows(self, table : str) -> list:
+        '''Fetches every row of a table on the shared read cursor.'''
+        query = f"select * from {self._quoted_table[table]}"
+        return self._read_cursor(query).execute(query).fetchall()
+
+    def _read_tables_parallel(self, tables : list) -> list:
+        '''Reads every row of each table, spread over up to self.read_workers extra connections.
+        The connections are opened for this call only, and closed before returning.
+        
+        Parameters
+        ----------
+        tables : list[str]
+            The names of the tables to read.
+
+        Returns
+        ----------
+        list[tuple[str, list]]
+            A list of (table_name, rows), in the same order as tables.
+        '''
+        local = threading.local()
+        connections = []
+
+        def read_table(table):
+            # Each worker thread opens its own connection the first time it's used
+            conn = getattr(local, 'conn', None)
+            if conn == None:
+                conn = local.conn = pyodbc.connect(self._connection_string)
+                connections.append(conn)
+            cursor = conn.cursor()
+            cursor.arraysize = DBConnection.fetch_size
+            rows = cursor.execute(f"select * from {self._quoted_table[table]}").fetchall()
+            cursor.close()
+            return table, rows
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.read_workers) as executor:
+                return list(executor.map(read_table, tables))
+        finally:
+            for conn in connections:
+                conn.close()
+
+    def iter_tags(self, tag_type : str = None):
+        '''Creates Tag objects from the database one at a time, as the rows are read.
+        Works the same as get_tags(), but without holding every tag in memory at once.
+        
+        Parameters
+        ----------
+        tag_type : str, optional
+            The name of the table this tag is found under in the tag export database.
+            Leave as default to get all tags from every table, one table after another.
+
+        Yields
+        ----------
+        Tag
+            Each Tag object, in database order.
+        '''
+        # Get all tags, or tags for a specific type
+        tables = list(self.table_columns) if tag_type == None else [tag_type]
+
+        # This cursor isn't one of the shared read cursors, since other queries may run between tags.
+        # It is reused for every table, and rows are pulled in large blocks.
+        cursor = self.conn.cursor()
+        cursor.arraysize = DBConnection.fetch_size
+        try:
+            for table in tables:
+                columns = self.table_columns[table]
+                cursor.execute(f"select * from {self._quoted_table[table]}")
+                while True:
+                    rows = cursor.fetchmany(DBConnection.fetch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield Tag(table, columns, row)
+        finally:
+            cursor.close()
+
+    def get_tags_columnar(self, tag_type : str) -> dict:
+        '''Gets every tag of the given type as columns of values, without creating a Tag object per row.
+        Useful for bulk reads where you only need to look through a few columns.
+        
+        Parameters
+        ----------
+        tag_type : str
+            The name of the table the tags are found under in the tag export database.
+
+        Returns
+        ----------
+        dict[str, list[str]]
+            A dictionary of { column_name: [value] }, where the values are in the same row order for every column.
+        '''
+        return self.get_tag_table(tag_type).data
+
+    def get_tag_table(self, tag_type : str) -> TagTable:
+        '''Gets every tag of the given type as a TagTable, without creating a Tag object per row.
+        
+        Parameters
+        ----------
+        tag_type : str
+            The name of the table the tags are found under in the tag export database.
+
+        Returns
+        ----------
+        TagTable
+            The tags, stored by column.
+        '''
+        return TagTable(tag_type, self.table_columns[tag_type], self._read_all_rows(tag_type))
+
+    def add_tags(self, tag_list : list, remove_id_info : bool = True, batch_size : int = 50):
         '''Appends the tags in tag_list to the database.
         
         Parameters
@@ -208,49 +586,133 @@ class DBConnection:
         remove_id_info : bool
             If True, sets the 'Export Info', 'AuditName', and 'Original Shortname' values to empty strings.
             Normally required when adding new tags to a database. (default is True)
+        batch_size : int
+            The most tags sent to the database in one executemany batch.
+            Batches are made smaller if needed to stay under DBConnection.max_batch_parameters. (default is 50)
         '''
         tags_by_type = Tag.separate_tags_by_type(tag_list)
 
         cursor = self.conn.cursor()
-        for tag_type in tags_by_type.keys():
-            for tag in tags_by_type[tag_type]:
+        cursor.fast_executemany = True
+        # Everything is committed together, or not at all
+        try:
+            for tag_type in tags_by_type:
+                # Tag values are stored in the registered column order for the tag type, so the query uses those columns too
+                query = self._insert_query(tag_type, Tag._column_names[tag_type])
+
+                # Send the tags of this type in batches, rather than one round trip per tag
                 if remove_id_info:
-                    tag.remove_id_info()
-                values = tag.values_as_list()
-                query = f"insert into {tag_type} ({','.join([f'[{x}]' for x in Tag._column_names[tag_type]])}) values ({','.join(['?']*len(values))})"
-                cursor.execute(query, values)
-        cursor.commit()
+                    for tag in tags_by_type[tag_type]:
+                        tag.remove_id_info()
+                # executemany only reads the parameters, so the tags' own value lists are passed without copying
+                params = [tag.values for tag in tags_by_type[tag_type]]
+                DBConnection._executemany_batched(cursor, query, params, batch_size)
+            self.conn.commit()
+        except:
+            self.conn.rollback()
+            raise
+        for tag_type in tags_by_type:
+            self._name_index.pop(tag_type, None)
+        return True
+
+    def add_tag_table(self, table : TagTable, remove_id_info : bool = True, batch_size : int = 50):
+        '''Appends every tag in a TagTable to the database, without creating a Tag object per row.
+        
+        Parameters
+        ----------
+        table : TagTable
+            The tags to add.
+        remove_id_info : bool
+            If True, sets the 'Export Info', 'AuditName', and 'Original Shortname' values to empty strings.
+            Normally required when adding new tags to a database. (default is True)
+        batch_size : int
+            The most tags sent to the database in one executemany batch.
+            Batches are made smaller if needed to stay under DBConnection.max_batch_parameters. (default is 50)
+        '''
+        if remove_id_info:
+            table.remove_id_info()
+
+        cursor = self.conn.cursor()
+        cursor.fast_executemany = True
+        try:
+            query = self._insert_query(table.tag_type, table.columns)
+            DBConnection._executemany_batched(cursor, query, list(table.rows()), batch_size)
+            self.conn.commit()
+        except:
+            self.conn.rollback()
+            raise
+        self._name_index.pop(table.tag_type, None)
         return True
 
+    @staticmethod
+    def _executemany_batched(cursor, query : str, params : list, batch_size : int):
+        '''Runs executemany over params in batches of at most batch_size rows,
+        made smaller where needed so no batch has more than DBConnection.max_batch_parameters parameters.'''
+        if len(params) == 0:
+            return
+        rows_per_batch = max(1, min(batch_size, DBConnection.max_batch_parameters // len(params[0])))
+        for i in range(0, len(params), rows_per_batch):
+            cursor.executemany(query, params[i:i + rows_per_batch])
+
+    def _insert_query(self, tag_type : str, columns : list) -> str:
+        '''Gets the insert query for tags of tag_type with the given columns.
+        This is the query cached on connection, unless the columns don't match this database's (ie: tags copied from another database).'''
+        if columns == self.table_columns.get(tag_type):
+            return self._insert_sql[tag_type]
+        return DBConnection._build_insert_sql(_quote_name(tag_type), [_quote_name(col) for col in columns])
+
+    def _update_query(self, tag_type : str, columns : list) -> str:
+        '''Gets the update query for tags of tag_type with the given columns, the same way as _insert_query.'''
+        if columns == self.table_columns.get(tag_type):
+            return self._update_sql[tag_type]
+        return DBConnection._build_update_sql(_quote_name(tag_type), [_quote_name(col) for col in columns])
+
     # TODO - return the # of rows updated
-    def update_tags(self, tag_list : list):
+    def update_tags(self, tag_list : list, batch_size : int = 50):
         '''Updates each tag in tag_list in the database, going by the Export Info field as the tag's ID.
         
         Parameters
         ----------
         tag_list : list[Tag]
             A list of Tag objects to update.
+        batch_size : int
+            The most tags sent to the database in one executemany batch.
+            Batches are made smaller if needed to stay under DBConnection.max_batch_parameters. (default is 50)
         '''
         tags_by_type = Tag.separate_tags_by_type(tag_list)
 
         cursor = self.conn.cursor()
-        for tag_type in tags_by_type.keys():
-            updated_columns = Tag._column_names[tag_type]
-            for tag in tags_by_type[tag_type]:
-                select_query = f'select * from {tag_type} where [Export Info - leave blank for new records] = ?'
-                updated_id = tag.get(Tag.id_col)
-                existing_tag = cursor.execute(select_query, [updated_id]).fetchone()
-                if existing_tag == None:
-                    raise Exception("Update failed - tag not found.")
-                params = tag.values_as_list()
-                params.append(updated_id)
-                query = f"update {tag_type} set {','.join([f'[{updated_columns[i]}]=?' for i in range(len(updated_columns))])} where [Export Info - leave blank for new records] = ?"
-                cursor.execute(query, params)
-        cursor.commit()
+        cursor.fast_executemany = True
+        cursor.arraysize = DBConnection.fetch_size
+        # Everything is committed together, or not at all
+        try:
+            for tag_type in tags_by_type:
+                updated_ids = [tag.get(Tag.id_col) for tag in tags_by_type[tag_type]]
+
+                # Check that every tag exists with as few queries as the parameter limit allows, rather than a select per tag
+                existing_ids = set()
+                for i in range(0, len(updated_ids), DBConnection.max_batch_parameters):
+                    batch_ids = updated_ids[i:i + DBConnection.max_batch_parameters]
+                    select_query = f"select {_quote_name(Tag.id_col)} from {_quote_name(tag_type)} where {_quote_name(Tag.id_col)} in ({','.join(['?']*len(batch_ids))})"
+                    existing_ids.update(_id_key(row[0]) for row in cursor.execute(select_query, batch_ids).fetchall())
+                missing_ids = [str(updated_id) for updated_id in updated_ids if _id_key(updated_id) not in existing_ids]
+                if missing_ids:
+                    raise Exception(f"Update failed - tag not found. Missing Export Info: {', '.join(missing_ids)}")
+
+                # Tag values are stored in the registered column order for the tag type, so the query uses those columns too
+                query = self._update_query(tag_type, Tag._column_names[tag_type])
+                params = [tag.values_as_list() + [tag.get(Tag.id_col)] for tag in tags_by_type[tag_type]]
+                DBConnection._executemany_batched(cursor, query, params, batch_size)
+            self.conn.commit()
+        except:
+            self.conn.rollback()
+            raise
+        for tag_type in tags_by_type:
+            self._name_index.pop(tag_type, None)
         return True
 
     # TODO - Remove need for tag_type
-    def get_tag_by_name(self, tag_type : str, name : str) -> Tag:
+    def get_tag_by_name(self, tag_type : str, name : str, exact : bool = False, cache : bool = False) -> Tag:
         '''Finds a single tag in the database by its Name (or ShortName).
         
         Parameters
@@ -259,6 +721,15 @@ class DBConnection:
             The name of the table this tag is found under in the tag export database.
         name : str
             The Name of the tag. Everything before the slashes is dropped, so this can be the full path or the Short Name.
+            The first tag whose Name is this Short Name, or ends in a slash followed by it, is returned.
+        exact : bool
+            If True, name must be the full Name of the tag, exactly as in the database.
+            This lets the database compare with "=" rather than scanning every Name with "like". (default is False)
+        cache : bool
+            If True, Short Names are looked up in an index of the whole table, read on the first such lookup.
+            This is faster when looking up many tags, but each tag's full row is held in memory until clear_name_index() is called,
+            or tags of this type are added or updated through this connection. Changes made to the database elsewhere aren't seen until then.
+            (default is False)
             
 
         Returns
@@ -266,12 +737,53 @@ class DBConnection:
         Tag
             The found Tag, if found. Otherwise, returns None.
         '''
-        cursor = self.conn.cursor()
-        name = name.split('\\\\')[-1]
-        cursor.execute(f"select * from {tag_type} where Name like '%' + ?", [name])
-        tag = cursor.fetchone()
+        if exact:
+            query = f"select * from {self._quoted_table[tag_type]} where [Name] = ?"
+            params = [name]
+        else:
+            name = name.rpartition('\\\\')[2]
+            if cache and '\\' not in name:
+                # Short names are looked up in memory, indexing the whole table on the first lookup
+                index = self._name_index.get(tag_type)
+                if index == None:
+                    index = self._build_name_index(tag_type)
+                tag = index.get(_id_key(name))
+                return Tag(tag_type, self.table_columns[tag_type], tag) if tag != None else None
+
+            # The wildcard goes in the parameter, so the query text is the same for every name
+            query = f"select * from {self._quoted_table[tag_type]} where [Name] = ? or [Name] like ?"
+            params = [name, '%\\' + name]
+        # Only the first match is used, so there's no point prefetching more than one row
+        cursor = self._read_cursor(query, arraysize=1)
+        tag = cursor.execute(query, params).fetchone()
         return Tag(tag_type, self.table_columns[tag_type], tag) if tag != None else None
 
+    def _build_name_index(self, tag_type : str) -> dict:
+        '''Reads every tag of the given type into a dictionary of { shortname: row } for get_tag_by_name.
+        Shortnames are keyed with _id_key, so lookups ignore case the same as the "like" query does in Access.
+        Where shortnames repeat, the first tag in the table is kept, the same as the "like" query gives.
+        The index is thrown away by clear_name_index(), or whenever tags of this type are added or updated through this connection.'''
+        name_col = self.table_columns[tag_type].index("Name")
+        index = {}
+        for row in self._read_all_rows(tag_type):
+            if row[name_col] != None:
+                index.setdefault(_id_key(row[name_col].rpartition('\\')[2]), row)
+        self._name_index[tag_type] = index
+        return index
+
+    def clear_name_index(self, tag_type : str = None):
+        '''Throws away the Short Name index used by get_tag_by_name(cache=True), so the next lookup reads the table again.
+        
+        Parameters
+        ----------
+        tag_type : str
+            The name of the table to clear the index for. If not given, the index for every table is cleared.
+        '''
+        if tag_type == None:
+            self._name_index.clear()
+        else:
+            self._name_index.pop(tag_type, None)
+
     def get_columns_by_type(self, tag_type : str) -> list:
         '''Gets the columns by type.
         This method is run and cached on instantiation as the self.table_columns dict, so shouldn't need to be run manually.
@@ -286,11 +798,23 @@ class DBConnection:
         list[str]
             The columns for the given tag type, in database order.
         '''
-        cursor = self.conn.cursor()
-        cursor.execute(f"select * from {tag_type}")
-        if len(cursor.description) == 0:
-            print (tag_type)
-        return [column[0] for column in cursor.description]
+        # The catalog has the columns without running a query on the table
+        # The table name is a search pattern there ("_" matches any character), so only rows for this exact table are kept
+        columns = sorted((row.ordinal_position, row.column_name) for row in self.conn.cursor().columns(table=tag_type) if row.table_name == tag_type)
+        return [sys.intern(col) for _, col in columns]
+
+    @staticmethod
+    def _build_insert_sql(quoted_table : str, quoted_columns : list) -> str:
+        '''Builds the parameterized insert query for a table, with one "?" per column, in column order.
+        The table and column names must already be quoted with _quote_name().'''
+        return f"insert into {quoted_table} ({','.join(quoted_columns)}) values ({','.join(['?']*len(quoted_columns))})"
+
+    @staticmethod
+    def _build_update_sql(quoted_table : str, quoted_columns : list) -> str:
+        '''Builds the parameterized update query for a table, with one "?" per column, in column order,
+        followed by a final "?" for the Export Info of the tag being updated.
+        The table and column names must already be quoted with _quote_name().'''
+        return f"update {quoted_table} set {','.join(f'{col}=?' for col in quoted_columns)} where {_quote_name(Tag.id_col)} = ?"
 
     def create_tag_template(self, tag_type : str) -> Tag:
         '''Creates an empty Tag object of the given tag type.
@@ -324,21 +848,60 @@ def ParseIFixCsv(filepath):
         Where each list item corresponds to a row in the CSV, and
         the column name is something like "TAG", "DESCRIPTION", "I/O DEVICE", etc.
     '''
-    with open(filepath) as f:
-        all_text = f.read()
-    
     output = []
-    tables = all_text.split('\n\n')[1:-1]
-    for table in tables:
-        lines = table.split('\n')
-        if len(lines) > 2: # Sanity check
-            columns = lines[0][1:-1].split(',') # Remove square brackets and split
-            reader = csv.DictReader(lines[2:], columns)
-            for row in reader:
-                output.append(row)
+    with open(filepath) as f:
+        # Tables are separated by blank lines. The first and last blocks aren't tables, so they're skipped.
+        # A table is only parsed once the next block is read, so we know it isn't the last.
+        blocks = _iter_blocks(f)
+        next(blocks, None)
+        lines = next(blocks, None)
+        for next_lines in blocks:
+            if len(lines) > 2: # Sanity check
+                columns = lines[0][1:-1].split(',') # Remove square brackets and split
+                output.extend(dict(zip(columns, row)) for row in csv.reader(lines[2:]) if row)
+            lines = next_lines
     return output
 
 
+def _iter_blocks(f):
+    '''Reads a text file one block at a time, where blocks are separated by a blank line.
+    Gives the same blocks as f.read().split('\\n\\n'), without reading the whole file into memory.
+
+    Parameters
+    ----------
+    f : file
+        The file to read, opened in text mode.
+
+    Yields
+    ----------
+    list[str]
+        The lines of each block, without their line endings.
+    '''
+    block = []
+    first_line = True
+    after_separator = False
+    ends_with_newline = True
+    for line in f:
+        ends_with_newline = line.endswith('\n')
+        if ends_with_newline:
+            line = line[:-1]
+
+        # An empty line ends the block, unless its leading newline was already used by the previous separator
+        if line == '' and ends_with_newline and not first_line and not after_separator:
+            yield block
+            block = []
+            after_separator = True
+        else:
+            block.append(line)
+            after_separator = False
+        first_line = False
+
+    # Splitting text that ends in a newline leaves an empty string on the end
+    if ends_with_newline:
+        block.append('')
+    yield block
+
+
 def GetPages(app_path):
     '''Gets the text for each page in the app.
     Ideally, I would like to create a full api for dealing with page data,
@@ -358,14 +921,20 @@ def GetPages(app_path):
     if '\\' not in app_path and '/' not in app_path:
         app_path = f'C:\\VTScada\\{app_path}'
     app_path = app_path.rstrip('\\')
-    pages = glob.iglob(f'{app_path}\\Pages\\*')
+    pages = _scan_dir(f'{app_path}\\Pages', '*')
+
+    # Reading is mostly waiting on the disk, so the pages are read on several threads at once
+    with ThreadPoolExecutor(max_workers=_FILE_READ_WORKERS) as executor:
+        return dict(executor.map(_read_page, pages))
 
-    page_dict = {}
-    for page in pages:
-        page_name = page.split('\\')[-1].rstrip('.SRC')
-        with open(page) as p:
-            page_dict[page_name] = p.read()
-    return page_dict
+
+def _read_page(page):
+    '''Reads a page file for GetPages, returning (page_name, page_text).'''
+    page_name = os.path.basename(page)
+    if page_name.endswith('.SRC'):
+        page_name = page_name[:-len('.SRC')]
+    with open(page) as p:
+        return page_name, p.read()
 
 
 def GetTagValues(app_path, tag_type = '*'):
@@ -391,24 +960,82 @@ def GetTagValues(app_path, tag_type = '*'):
     if '\\' not in app_path and '/' not in app_path:
         app_path = f'C:\\VTScada\\{app_path}'
     app_path = app_path.rstrip('\\')
-    tag_files = glob.iglob(f'{app_path}\\Tags\\{tag_type}_*\\*.tag')
+    tag_files = (file for tag_dir in _scan_dir(f'{app_path}\\Tags', f'{tag_type}_*', dirs=True)
+                      for file in _scan_dir(tag_dir, '*.tag'))
 
+    # Reading is mostly waiting on the disk, so the files are parsed on several threads at once
     tag_dict = {}
-    line = None
-    for file in tag_files:
-        with open(file) as f:
-            for line in f.readlines():
-                line = line.split(',')
-
-                tag_id = line[0].replace('\\', '\\\\')
-                prop_name = line[1][:line[1].index('<')] if '<' in line[1] else line[1]
-                prop_val = line[2].rstrip('\n') if len(line) == 3 else ''
-
-                if tag_id in tag_dict.keys():
-                    # DEBUG
-                    if prop_name in tag_dict[tag_id]:
-                        raise Exception('DUPLICATE PROPERTY FOUND ON TAG ID = ' + tag_id)
-                    tag_dict[tag_id][prop_name] = prop_val
-                else:
-                    tag_dict[tag_id] = {prop_name: prop_val}
+    with ThreadPoolExecutor(max_workers=_FILE_READ_WORKERS) as executor:
+        for file_dict in executor.map(_parse_tag_file, tag_files):
+            for tag_id, file_props in file_dict.items():
+                props = tag_dict.get(tag_id)
+                if props == None:
+                    tag_dict[tag_id] = file_props
+                    continue
+                # DEBUG
+                if any(prop_name in props for prop_name in file_props):
+                    raise Exception('DUPLICATE PROPERTY FOUND ON TAG ID = ' + tag_id)
+                props.update(file_props)
     return tag_dict
+
+
+def _parse_tag_file(file):
+    '''Parses a single .tag file for GetTagValues.
+
+    Parameters
+    ----------
+    file : str
+        The full path to the .tag file.
+
+    Returns
+    ----------
+    dict[str, dict[str, str]]
+        A dictionary of dictionaries that looks like {tag_id : { property : value } }, for the tags in this file.
+    '''
+    tag_dict = defaultdict(dict)
+    raw_id = None
+    with open(file) as f:
+        for line in f:
+            # Lines look like: tag_id,property<index>,value
+            parts = line.rstrip('\n').split(',', 2)
+
+            # A tag's properties are usually on consecutive lines, so only look the tag up again when the ID changes
+            if parts[0] != raw_id:
+                raw_id = parts[0]
+                tag_id = raw_id.replace('\\', '\\\\')
+                props = tag_dict[tag_id]
+
+            prop_name = parts[1].partition('<')[0]
+            prop_val = parts[2] if len(parts) == 3 else ''
+
+            # DEBUG
+            if prop_name in props:
+                raise Exception('DUPLICATE PROPERTY FOUND ON TAG ID = ' + tag_id)
+            props[prop_name] = prop_val
+    return dict(tag_dict)
+
+
+def _scan_dir(path, pattern, dirs = False):
+    '''Lists the files (or directories) directly in path whose names match pattern.
+    Works like glob, but uses the file type that os.scandir already has, rather than a stat call per entry.
+
+    Parameters
+    ----------
+    path : str
+        The directory to look in.
+    pattern : str
+        A glob-style pattern for the names to match, ie: "*.tag".
+    dirs : bool
+        If True, lists directories instead of files. (default is False)
+
+    Returns
+    ----------
+    list[str]
+        The full paths of the matching entries, or an empty list if path doesn't exist.
+    '''
+    try:
+        with os.scandir(path) as entries:
+            return [entry.path for entry in entries
+                    if (entry.is_dir() if dirs else entry.is_file()) and fnmatch(entry.name, pattern)]
+    except FileNotFoundError:
+        return []